@@ -18,12 +18,21 @@ Key Learning Objectives:
 - Building production-ready agents with proper error handling
 """
 
+import asyncio
+import atexit
 import os
+import sys
+from contextlib import contextmanager
+from functools import lru_cache
 from pathlib import Path
-from mcp.client.sse import sse_client
-from strands import Agent, tool
-from strands.tools.mcp import MCPClient
+import httpx
+import openai
+from strands import Agent, ModelRetryStrategy, tool
 from strands.models.openai import OpenAIModel
+from tenacity import AsyncRetrying, retry_if_exception, stop_after_attempt, wait_exponential
+from cache import ResponseCache, load_tool_specs, save_tool_specs
+from model_params import MODEL_PARAMS
+from tool_pool import PooledTool, ToolPool
 
 # Configuration from environment variables
 # These are set by Docker Compose and the entrypoint script
@@ -40,9 +49,85 @@ OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")  # Set by entrypoint from Docker se
 # The MCP Gateway provides secure access to external tools and APIs
 MCP_SERVER_URL = os.getenv("MCP_SERVER_URL", "http://mcp-gateway:8811/sse")
 
+# Keep one MCP Gateway connection open for the life of the process (MCP_PERSISTENT=1)
+# instead of reconnecting per run; useful when the agent runs inside a long-lived worker
+MCP_PERSISTENT = os.getenv("MCP_PERSISTENT", "0") == "1"
+
 # Default question for the agent to process
 QUESTION = os.getenv("QUESTION", "Define Zorgon")
 
+# Optional batch of questions (one per line) processed concurrently instead of QUESTION
+QUESTIONS = [q.strip() for q in os.getenv("QUESTIONS", "").splitlines() if q.strip()]
+
+# Maximum number of questions in flight at once when processing QUESTIONS
+MAX_CONCURRENCY = int(os.getenv("MAX_CONCURRENCY", "10"))
+
+# Connection pool for model requests: one keep-alive pool shared by every agent
+# in a run, so concurrent and follow-up requests skip TCP/TLS setup
+HTTP_LIMITS = httpx.Limits(max_keepalive_connections=32, max_connections=64)
+HTTP_TIMEOUT = httpx.Timeout(30.0, read=300.0)  # Allow long generations between chunks
+
+# Total attempts per model call. Throttling (429) is retried by the Strands
+# agent itself (LoggingRetryStrategy); connection errors, timeouts and 5xx by
+# tenacity. The OpenAI SDK's own retries are disabled so the layers don't multiply.
+MODEL_MAX_ATTEMPTS = 3
+
+# Model errors retried by tenacity: dropped connections, timeouts, 5xx
+TRANSIENT_MODEL_ERRORS = (
+    openai.APIConnectionError,
+    openai.APITimeoutError,
+    openai.InternalServerError,
+)
+
+# Output directory for saved definitions - this maps to a Docker volume
+DEFINITIONS_DIR = Path("/app/definitions")
+
+class _FilenameCharFilter(dict):
+    """
+    str.translate table that keeps alphanumerics, spaces, '-' and '_'.
+    
+    Each code point is classified once on first sight and memoized, so
+    sanitizing runs as a C-level translate instead of a per-character loop,
+    while still accepting non-ASCII letters (e.g. "Café").
+    """
+    
+    def __missing__(self, codepoint):
+        char = chr(codepoint)
+        self[codepoint] = char if char.isalnum() or char in " -_" else None
+        return self[codepoint]
+
+_FILENAME_CHARS = _FilenameCharFilter()
+
+@lru_cache(maxsize=64)
+def _separator(length):
+    """Underline for a definition header; common lengths are built only once."""
+    return "=" * length
+
+# Invariant part of the system prompt. Keeping it a module constant (with the
+# question appended last) avoids rebuilding it per question and keeps the prompt
+# prefix identical across requests, so provider-side prompt caching can hit
+_SYSTEM_PROMPT_PREFIX = """You are an intelligent research assistant with access to external tools through MCP Gateway.
+
+Your task is to research and define terms by:
+1. Using the search tool to find accurate, comprehensive information
+2. Synthesizing the information into a clear, well-structured definition
+3. Saving the definition using the save_definition tool
+4. Confirming completion to the user
+
+## Example Workflow:
+
+Question: "What is photosynthesis?"
+
+1. Search for information: search(query="photosynthesis definition biology")
+2. Analyze and synthesize the results
+3. Save the definition: save_definition("Photosynthesis", "comprehensive definition here")
+4. Confirm completion
+
+"""
+
+# Process-wide MCP client, created on first use when MCP_PERSISTENT is enabled
+_MCP_CLIENT = None
+
 @tool
 def save_definition(word: str, definition: str) -> str:
     """
@@ -61,31 +146,47 @@ def save_definition(word: str, definition: str) -> str:
         
     Docker Integration Notes:
     - Files are saved to /app/definitions (mounted as Docker volume)
-    - Directory is created automatically if it doesn't exist
+    - Directory is created automatically on the first save if it doesn't exist
     - Files persist between container restarts due to volume mounting
     - Proper error handling for file system operations
     """
     try:
-        # Create output directory - this maps to a Docker volume
-        out_dir = Path("/app/definitions")
-        out_dir.mkdir(exist_ok=True)
-        
         # Create filename from word (sanitize for filesystem)
-        safe_word = "".join(c for c in word if c.isalnum() or c in (' ', '-', '_')).strip()
-        file_path = out_dir / f"{safe_word}.txt"
+        safe_word = word.translate(_FILENAME_CHARS).strip()
+        file_path = DEFINITIONS_DIR / f"{safe_word}.txt"
         
-        # Write definition to file with proper formatting
-        with open(file_path, "w", encoding="utf-8") as f:
-            f.write(f"Definition of '{word}':\n")
-            f.write("=" * (len(word) + 15) + "\n\n")
-            f.write(definition.strip() + "\n")
+        # Build the formatted file in memory and write it with a single call
+        payload = (
+            f"Definition of '{word}':\n"
+            + _separator(len(word) + 15) + "\n\n"
+            + definition.strip() + "\n"
+        )
+        data = payload.encode("utf-8")
+        try:
+            file_path.write_bytes(data)
+        except FileNotFoundError:
+            # Only create the output directory when it is actually missing
+            DEFINITIONS_DIR.mkdir(parents=True, exist_ok=True)
+            file_path.write_bytes(data)
         
         return f"✅ The definition for '{word}' has been found and saved to {file_path.name}. Mission Completed!"
         
     except Exception as e:
         return f"❌ Error saving definition for '{word}': {str(e)}"
 
-def get_model():
+def create_http_client():
+    """
+    Create the pooled HTTP client shared by all model requests in a run.
+    
+    An httpx.AsyncClient may only be used from one event loop, so main()
+    creates one per run and closes it with run_model_calls().
+    
+    Returns:
+        httpx.AsyncClient: Keep-alive client using HTTP_LIMITS and HTTP_TIMEOUT
+    """
+    return httpx.AsyncClient(limits=HTTP_LIMITS, timeout=HTTP_TIMEOUT)
+
+def get_model(http_client):
     """
     Auto-detect and configure the appropriate AI model based on environment.
     
@@ -93,6 +194,10 @@ def get_model():
     credentials and configuration. It supports both local models via Docker
     Model Runner and cloud models via OpenAI API.
     
+    Args:
+        http_client (httpx.AsyncClient): Pooled client reused for every request
+            (see create_http_client)
+    
     Returns:
         OpenAIModel: Configured model instance ready for use
         
@@ -104,45 +209,376 @@ def get_model():
     - API keys are loaded from Docker secrets (more secure than env vars)
     - Local models use dummy API key for compatibility
     - Model selection is logged for debugging
+    
+    Performance Notes:
+    - The OpenAI client is injected so Strands reuses its connection pool
+      instead of opening a new client (and connections) for every request
     """
     
     # Check if we have a valid OpenAI API key (not the dummy key used for local models)
     if OPENAI_API_KEY and OPENAI_API_KEY != "sk-insecure":
         print(f"🌐 Configuring OpenAI model: {OPENAI_MODEL_NAME}")
         return OpenAIModel(
-            client_args={
-                "api_key": OPENAI_API_KEY  # Real API key from Docker secrets
-            },
+            client=openai.AsyncOpenAI(
+                api_key=OPENAI_API_KEY,  # Real API key from Docker secrets
+                http_client=http_client,
+                max_retries=0  # Retries are handled by the agent (see MODEL_MAX_ATTEMPTS)
+            ),
             model_id=OPENAI_MODEL_NAME,
-            params={
-                "temperature": 0.1,  # Slightly creative but focused
-                "max_tokens": 1000   # Allow longer responses for definitions
-            }
+            params=dict(MODEL_PARAMS)
         )
     else:
         print(f"🏠 Configuring local model via Docker Model Runner: {MODEL_RUNNER_MODEL}")
         return OpenAIModel(
-            client_args={
-                "api_key": "sk-insecure",      # Dummy key for local models
-                "base_url": MODEL_RUNNER_URL   # Docker Model Runner endpoint
-            },
+            client=openai.AsyncOpenAI(
+                api_key="sk-insecure",      # Dummy key for local models
+                base_url=MODEL_RUNNER_URL,  # Docker Model Runner endpoint
+                http_client=http_client,
+                max_retries=0  # Retries are handled by the agent (see MODEL_MAX_ATTEMPTS)
+            ),
             model_id=MODEL_RUNNER_MODEL,
-            params={
-                "temperature": 0.1,  # Consistent behavior
-                "max_tokens": 1000   # Allow longer responses
-            }
+            params=dict(MODEL_PARAMS)
         )
 
+async def run_model_calls(coro, http_client):
+    """
+    Await model work, then close the shared HTTP client on the same event loop.
+    
+    Args:
+        coro: Coroutine performing the model requests
+        http_client (httpx.AsyncClient): Client passed to get_model()
+        
+    Returns:
+        The coroutine's result
+    """
+    async with http_client:
+        return await coro
+
+def create_mcp_client():
+    """
+    Create (but don't start) an MCP client for the MCP Gateway.
+    
+    The transport is chosen from MCP_SERVER_URL:
+    - ws:// or wss:// → WebSocket (bidirectional, requires the "ws" extra)
+    - URL ending in /sse → Server-Sent Events (the default gateway setup)
+    - any other http(s):// URL → Streamable HTTP (e.g. http://mcp-gateway:8811/mcp
+      with the gateway started using --transport=streaming)
+    
+    WebSocket and Streamable HTTP carry every tool call over the session's
+    existing connection, while SSE pairs the event stream with a separate
+    POST request per message.
+    
+    The MCP libraries are imported here rather than at module level, so runs
+    that never reach the gateway (e.g. answers served from the response
+    cache) don't pay for importing them at container start.
+    
+    Returns:
+        MCPClient: MCP client using the selected transport
+    """
+    from strands.tools.mcp import MCPClient
+    
+    if MCP_SERVER_URL.startswith(("ws://", "wss://")):
+        from mcp.client.websocket import websocket_client
+        return MCPClient(lambda: websocket_client(MCP_SERVER_URL))
+    
+    if MCP_SERVER_URL.rstrip("/").endswith("/sse"):
+        from mcp.client.sse import sse_client
+        return MCPClient(lambda: sse_client(MCP_SERVER_URL))
+    
+    from mcp.client.streamable_http import streamablehttp_client
+    return MCPClient(lambda: streamablehttp_client(MCP_SERVER_URL))
+
+def get_mcp_client():
+    """
+    Return the process-wide MCP client, connecting on first use.
+    
+    Entering an MCPClient performs the full connection and MCP handshake, so
+    long-running workers reuse one started client across runs. It is closed
+    when the interpreter exits.
+    
+    Returns:
+        MCPClient: Started MCP client
+    """
+    global _MCP_CLIENT
+    if _MCP_CLIENT is None:
+        client = create_mcp_client()
+        client.__enter__()
+        atexit.register(client.__exit__, None, None, None)
+        _MCP_CLIENT = client
+    return _MCP_CLIENT
+
+@contextmanager
+def mcp_session():
+    """
+    Provide a started MCP client for the duration of a run.
+    
+    With MCP_PERSISTENT enabled the shared client from get_mcp_client() is
+    yielded and left open; otherwise a fresh client is connected and closed
+    when the block exits, even if errors occur.
+    
+    Yields:
+        MCPClient: Started MCP client
+    """
+    if MCP_PERSISTENT:
+        yield get_mcp_client()
+    else:
+        with create_mcp_client() as mcp_client:
+            yield mcp_client
+
+def get_cached_tools(mcp_client, url):
+    """
+    Discover MCP tools, reusing descriptors cached by a previous run.
+    
+    Tool discovery is a full round-trip to the MCP Gateway on the startup
+    path. The descriptors only change when the gateway is reconfigured, so
+    they are cached on disk for TOOL_CACHE_TTL seconds and rebound to the
+    live client on a hit. A cache file that no longer validates is treated
+    as a miss.
+    
+    Args:
+        mcp_client (MCPClient): Started MCP client used to execute the tools
+        url (str): MCP Gateway URL (the cache key)
+        
+    Returns:
+        list: MCP tools ready to pass to an Agent
+    """
+    specs = load_tool_specs(url)
+    if specs is not None:
+        from mcp.types import Tool
+        from strands.tools.mcp import MCPAgentTool
+        
+        try:
+            tools = [MCPAgentTool(Tool.model_validate(spec), mcp_client) for spec in specs]
+        except (ValueError, TypeError) as e:  # pydantic.ValidationError is a ValueError
+            # Written by another mcp version or damaged: rediscover and overwrite it
+            print(f"⚠️ Ignoring stale MCP tool cache: {e}")
+        else:
+            print(f"⚡ Loaded {len(tools)} MCP tools from cache")
+            return tools
+    
+    mcp_tools = mcp_client.list_tools_sync()
+    save_tool_specs(url, [t.mcp_tool.model_dump(mode="json", by_alias=True) for t in mcp_tools])
+    return mcp_tools
+
+def build_system_prompt(question):
+    """
+    Build the research assistant system prompt for a question.
+    
+    Only the short question tail varies; the instructions come from the
+    constant _SYSTEM_PROMPT_PREFIX so they stay byte-identical across runs.
+    
+    Args:
+        question (str): The question the agent will research
+        
+    Returns:
+        str: Complete system prompt
+    """
+    return (
+        _SYSTEM_PROMPT_PREFIX
+        + f"## Your Task:\nQuestion: {question}\n\n"
+        + "Please research this term and provide a comprehensive definition."
+    )
+
+class LoggingRetryStrategy(ModelRetryStrategy):
+    """
+    Strands throttling retry strategy that reports each retry.
+    
+    ModelRetryStrategy only logs at debug level, so without this a rate-limited
+    (429) model call would be retried silently, unlike the transient errors
+    retried by tenacity (see log_retry).
+    """
+    
+    def __init__(self, max_attempts=MODEL_MAX_ATTEMPTS, **kwargs):
+        super().__init__(max_attempts=max_attempts, **kwargs)
+        self.max_attempts = max_attempts
+    
+    def is_retryable(self, exception):
+        retryable = super().is_retryable(exception)
+        # Called once per failed call, before the base class counts the attempt
+        attempt = self._current_attempt + 1
+        if retryable and attempt < self.max_attempts:
+            print(
+                f"⚠️ Model call throttled (attempt {attempt}/{self.max_attempts}): "
+                f"{exception} - retrying in {self._calculate_delay(self._current_attempt)}s"
+            )
+        return retryable
+
+def create_agent(model, tools, question, **kwargs):
+    """
+    Create a research agent for a single question.
+    
+    Each question gets its own Agent because the system prompt embeds the
+    question and an Agent keeps per-conversation message history.
+    
+    Args:
+        model: Configured model instance (see get_model)
+        tools (list): Combined MCP and custom tools
+        question (str): The question this agent will research
+        **kwargs: Extra Agent options (e.g. callback_handler)
+        
+    Returns:
+        Agent: Agent ready to process the question
+    """
+    return Agent(
+        model=model,
+        tools=tools,
+        system_prompt=build_system_prompt(question),
+        # Retry throttled model calls with the same budget as other transient errors
+        retry_strategy=LoggingRetryStrategy(initial_delay=1, max_delay=30),
+        **kwargs
+    )
+
+def cache_payload(model, question):
+    """
+    Describe a request for the response cache.
+    
+    Everything that influences the answer is part of the payload, so a change
+    of model, parameters or prompt never serves a stale response. The prompt
+    is recorded as a template so semantically similar questions share a scope.
+    """
+    return {
+        **model.get_config(),  # model_id and params
+        "system_prompt": build_system_prompt("{question}"),
+        "question": question,
+    }
+
+def saved_definitions(messages):
+    """
+    Collect the definitions an agent saved, so a cache hit can write them again.
+    
+    Args:
+        messages (list): Agent conversation history (agent.messages)
+        
+    Returns:
+        list[list[str]]: [word, definition] for each successful save_definition call
+    """
+    succeeded = {
+        block["toolResult"]["toolUseId"]
+        for message in messages for block in message["content"]
+        if "toolResult" in block and block["toolResult"]["status"] == "success"
+    }
+    return [
+        [block["toolUse"]["input"]["word"], block["toolUse"]["input"]["definition"]]
+        for message in messages for block in message["content"]
+        if "toolUse" in block
+        and block["toolUse"]["name"] == "save_definition"
+        and block["toolUse"]["toolUseId"] in succeeded
+    ]
+
+def is_transient_error(error):
+    """
+    Check whether an agent failure was caused by a transient model error.
+    
+    The agent event loop may wrap the original model exception, so the whole
+    exception chain is inspected.
+    """
+    while error is not None:
+        if isinstance(error, TRANSIENT_MODEL_ERRORS):
+            return True
+        error = error.__cause__
+    return False
+
+def log_retry(retry_state):
+    """Report a failed model call before tenacity waits and tries again."""
+    max_attempts = retry_state.retry_object.stop.max_attempt_number
+    print(
+        f"⚠️ Model call failed (attempt {retry_state.attempt_number}/{max_attempts}): "
+        f"{retry_state.outcome.exception()} - retrying in {retry_state.next_action.sleep:.0f}s"
+    )
+
+# Retry transient model failures with exponential backoff, instead of failing
+# the whole container (and paying MCP setup again on restart)
+MODEL_RETRY_POLICY = dict(
+    stop=stop_after_attempt(MODEL_MAX_ATTEMPTS),
+    wait=wait_exponential(multiplier=1, min=1, max=30),
+    before_sleep=log_retry,
+    reraise=True,
+)
+
+async def ask(model, tools, question, stream=False):
+    """
+    Answer a question with a fresh agent, retrying transient model errors.
+    
+    A new Agent is created for every attempt so a failed attempt never leaves
+    a dangling message in the conversation history.
+    
+    Args:
+        model: Configured model instance (see get_model)
+        tools (list): Combined MCP and custom tools
+        question (str): The question to answer
+        stream (bool): Write text to stdout as tokens arrive, so the user sees
+            output at first-token latency instead of after the full response.
+            Once any text has been written the call is no longer retried, as a
+            rerun would print the response a second time.
+        
+    Returns:
+        tuple[str, list]: The agent's final response and the definitions it
+            saved (see saved_definitions)
+    """
+    streamed = False
+    
+    def should_retry(error):
+        return not streamed and is_transient_error(error)
+    
+    async for attempt in AsyncRetrying(retry=retry_if_exception(should_retry), **MODEL_RETRY_POLICY):
+        with attempt:
+            agent = create_agent(model, tools, question, callback_handler=None)
+            
+            result = None
+            async for event in agent.stream_async(question):
+                if stream and "data" in event:
+                    streamed = True
+                    sys.stdout.write(event["data"])
+                    sys.stdout.flush()
+                result = event.get("result", result)
+    return str(result), saved_definitions(agent.messages)
+
+async def run_many(questions, model, tools, cache):
+    """
+    Process several questions concurrently.
+    
+    Model calls are network-bound, so overlapping them with asyncio.gather
+    gives a near-linear speedup over answering questions one by one. The
+    Strands OpenAIModel already talks to the endpoint through AsyncOpenAI,
+    so each agent is driven natively on the event loop rather than a thread.
+    
+    Args:
+        questions (list[str]): Questions to process (cache misses)
+        model: Configured model instance (see get_model)
+        tools (list): Combined MCP and custom tools
+        cache (ResponseCache): Cache each answer is stored in as it completes
+        
+    Returns:
+        list: Agent responses, in the same order as questions; a question
+            that failed holds its exception instead, so one error doesn't
+            discard the answers to the others
+        
+    Concurrency Notes:
+    - At most MAX_CONCURRENCY questions are in flight at once
+    - Streaming output is disabled so concurrent answers don't interleave
+    """
+    semaphore = asyncio.Semaphore(MAX_CONCURRENCY)
+    
+    async def run_one(question):
+        async with semaphore:
+            response, definitions = await ask(model, tools, question)
+        
+        cache.store(cache_payload(model, question), response, definitions)
+        return response
+    
+    return await asyncio.gather(*(run_one(question) for question in questions), return_exceptions=True)
+
 def main():
     """
     Main function demonstrating advanced Strands agent with MCP Gateway integration.
     
     This function showcases:
     1. Automatic model detection and configuration
-    2. MCP Gateway connection and tool discovery
-    3. Agent creation with both MCP and custom tools
-    4. Proper error handling and resource management
-    5. Context manager usage for MCP client lifecycle
+    2. Response cache lookup before any MCP Gateway work
+    3. MCP Gateway connection and tool discovery
+    4. Agent creation with both MCP and custom tools
+    5. Proper error handling and resource management
+    6. Context manager usage for MCP client lifecycle
     """
     
     print("🚀 Starting Advanced Strands Agent with MCP Gateway Integration")
@@ -150,63 +586,93 @@ def main():
     
     try:
         # Step 1: Configure the AI model (local or cloud)
-        model = get_model()
+        http_client = create_http_client()
+        model = get_model(http_client)
+        cache = ResponseCache()
+        
+        # Step 2: Reuse previous answers before touching the MCP Gateway
+        # Cache hits skip the MCP connection and tool discovery entirely
+        questions = QUESTIONS or [QUESTION]
+        if QUESTIONS:
+            print(f"📝 Processing {len(QUESTIONS)} questions (max {MAX_CONCURRENCY} concurrent)")
+        else:
+            print(f"📝 Processing question: {QUESTION}")
         
-        # Step 2: Initialize MCP Gateway connection
+        entries = [cache.lookup(cache_payload(model, q)) for q in questions]
+        responses = [entry["response"] if entry is not None else None for entry in entries]
+        pending = [q for q, response in zip(questions, responses) if response is None]
+        if len(pending) < len(questions):
+            print(f"⚡ {len(questions) - len(pending)} answer(s) served from response cache")
+            
+            # Write the definition files the original run saved, as the agent would have
+            for entry in filter(None, entries):
+                for word, definition in entry["definitions"]:
+                    print(save_definition(word, definition))
+        
+        if not pending:
+            for question, response in zip(questions, responses):
+                print("\n" + "=" * 60)
+                print(f"🎯 Agent Response ({question}):" if QUESTIONS else "🎯 Agent Response:")
+                print(response)
+            print("=" * 60)
+            return
+        
+        # Step 3: Initialize MCP Gateway connection
         # MCP Gateway provides secure access to external tools and APIs
         print(f"🔗 Connecting to MCP Gateway at: {MCP_SERVER_URL}")
-        mcp_client = MCPClient(lambda: sse_client(MCP_SERVER_URL))
         
-        # Step 3: Use context manager for proper resource management
+        # Step 4: Use context manager for proper resource management
         # This ensures MCP connection is properly closed even if errors occur
-        with mcp_client:
+        # (or kept open for reuse when MCP_PERSISTENT is enabled)
+        with mcp_session() as mcp_client:
             print("✅ MCP Gateway connection established")
             
-            # Step 4: Discover available tools from MCP Gateway
+            # Step 5: Discover available tools from MCP Gateway
             # MCP Gateway can provide search, file operations, API access, etc.
-            mcp_tools = mcp_client.list_tools_sync()
+            mcp_tools = get_cached_tools(mcp_client, MCP_SERVER_URL)
                        
-            # Step 5: Create agent with combined tool set
+            # Step 6: Create agent with combined tool set
             # Combine MCP-provided external tools with custom local tools
-            all_tools = mcp_tools + [save_definition]
+            # MCP tools run through a pool that caps concurrency and calls per minute
+            tool_pool = ToolPool()
+            all_tools = [PooledTool(t, tool_pool) for t in mcp_tools] + [save_definition]
             print(f"🤖 Creating agent with {len(all_tools)} total tools")
             
-            agent = Agent(
-                model=model,
-                tools=all_tools,
-                system_prompt=f"""You are an intelligent research assistant with access to external tools through MCP Gateway.
-
-Your task is to research and define terms by:
-1. Using the search tool to find accurate, comprehensive information
-2. Synthesizing the information into a clear, well-structured definition
-3. Saving the definition using the save_definition tool
-4. Confirming completion to the user
-
-## Example Workflow:
-
-Question: "What is photosynthesis?"
-
-1. Search for information: search(query="photosynthesis definition biology")
-2. Analyze and synthesize the results
-3. Save the definition: save_definition("Photosynthesis", "comprehensive definition here")
-4. Confirm completion
-
-## Your Task:
-Question: {QUESTION}
-
-Please research this term and provide a comprehensive definition."""
-            )
-            
-            # Step 6: Execute the agent task
-            print(f"📝 Processing question: {QUESTION}")
-            print("🔄 Agent is working...")
-            
-            response = agent(QUESTION)
-            
-            print("\n" + "=" * 60)
-            print("🎯 Agent Response:")
-            print(response)
-            print("=" * 60)
+            # Step 7: Execute the agent task(s)
+            if QUESTIONS:
+                print("🔄 Agents are working...")
+                
+                answers = iter(asyncio.run(run_model_calls(run_many(pending, model, all_tools, cache), http_client)))
+                responses = [response if response is not None else next(answers) for response in responses]
+                
+                failures = []
+                for question, response in zip(QUESTIONS, responses):
+                    print("\n" + "=" * 60)
+                    print(f"🎯 Agent Response ({question}):")
+                    if isinstance(response, Exception):
+                        failures.append(response)
+                        print(f"❌ Error: {response}")
+                    else:
+                        print(response)
+                print("=" * 60)
+                
+                # Answered questions are printed (and cached) first; a failed one
+                # still fails the run so the container exits non-zero
+                if failures:
+                    print(f"❌ {len(failures)} of {len(QUESTIONS)} questions failed")
+                    raise failures[0]
+            else:
+                print("🔄 Agent is working...")
+                print("\n" + "=" * 60)
+                print("🎯 Agent Response:")
+                
+                # The response is streamed to stdout as it is generated
+                response, definitions = asyncio.run(
+                    run_model_calls(ask(model, all_tools, QUESTION, stream=True), http_client)
+                )
+                cache.store(cache_payload(model, QUESTION), response, definitions)
+                print()
+                print("=" * 60)
             
     except Exception as e:
         print(f"❌ Error during agent execution: {str(e)}")
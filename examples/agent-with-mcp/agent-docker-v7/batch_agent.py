@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+"""
+Batch Question Answering with LiteLLM (v7)
+
+A lightweight companion to agent.py for batch evaluation workloads, such as
+defining many terms at once. Instead of running a full agent (with MCP tools)
+per question, every question is sent straight to the model and all requests
+are overlapped with asyncio.gather.
+
+Key Learning Objectives:
+- Using async model calls to overlap network-bound requests
+- Bounding concurrency to respect local (OLLAMA_NUM_PARALLEL) or provider rate limits
+- Sharing the same model configuration as the main agent
+
+Runs outside the entrypoint script, so the OpenAI key is read from the
+openai-api-key Docker secret (or OPENAI_API_KEY) here as well.
+
+Usage:
+    docker compose run --rm -e QUESTIONS=$'Define Entropy\nDefine Enthalpy' agent python -u batch_agent.py
+    docker compose run --rm -e QUESTIONS_FILE=/app/definitions/questions.txt agent python -u batch_agent.py
+"""
+
+import asyncio
+import os
+import time
+import litellm
+from model_params import MODEL_PARAMS
+
+# Docker Model Runner configuration for local AI models
+MODEL_RUNNER_URL = os.getenv("MODEL_RUNNER_URL", "http://model-runner.docker.internal/engines/llama.cpp/v1")
+MODEL_RUNNER_MODEL = os.getenv("MODEL_RUNNER_MODEL", "ai/gemma3:1B-Q4_K_M")
+
+# OpenAI configuration for cloud models
+OPENAI_MODEL_NAME = os.getenv("OPENAI_MODEL_NAME", "gpt-4o-mini")
+OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")
+OPENAI_SECRET_FILE = "/run/secrets/openai-api-key"  # Docker secret, see compose.openai.yaml
+
+# Questions to answer: one per line, from QUESTIONS or a file named by QUESTIONS_FILE
+QUESTIONS = os.getenv("QUESTIONS", "")
+QUESTIONS_FILE = os.getenv("QUESTIONS_FILE")
+
+# Maximum requests in flight; match OLLAMA_NUM_PARALLEL or your provider's rate limit
+MAX_CONCURRENCY = int(os.getenv("MAX_CONCURRENCY", os.getenv("OLLAMA_NUM_PARALLEL", "10")))
+
+def load_questions():
+    """
+    Read the batch of questions, one per line, skipping blank lines.
+
+    Returns:
+        list[str]: Questions to answer
+    """
+    text = QUESTIONS
+    if QUESTIONS_FILE:
+        with open(QUESTIONS_FILE, encoding="utf-8") as f:
+            text = f.read()
+    return [q.strip() for q in text.splitlines() if q.strip()]
+
+def get_openai_api_key():
+    """
+    Return the OpenAI API key the same way the entrypoint script resolves it.
+    
+    `docker compose run ... python batch_agent.py` bypasses /entrypoint.sh, so
+    the Docker secret has to be read here rather than relying on it being
+    exported as OPENAI_API_KEY.
+    """
+    if os.path.isfile(OPENAI_SECRET_FILE):
+        with open(OPENAI_SECRET_FILE, encoding="utf-8") as f:
+            return f.read().strip()
+    return OPENAI_API_KEY
+
+def get_completion_args():
+    """
+    Build LiteLLM completion arguments for the configured model.
+
+    Uses the same selection logic as agent.get_model(): OpenAI when a real
+    API key is available, otherwise the OpenAI-compatible Docker Model Runner.
+
+    Returns:
+        dict: Keyword arguments for litellm.acompletion
+    """
+    api_key = get_openai_api_key()
+    if api_key and api_key != "sk-insecure":
+        print(f"🌐 Configuring OpenAI model: {OPENAI_MODEL_NAME}")
+        return {"model": f"openai/{OPENAI_MODEL_NAME}", "api_key": api_key}
+
+    print(f"🏠 Configuring local model via Docker Model Runner: {MODEL_RUNNER_MODEL}")
+    return {
+        "model": f"openai/{MODEL_RUNNER_MODEL}",  # OpenAI-compatible endpoint
+        "api_base": MODEL_RUNNER_URL,
+        "api_key": "sk-insecure",                 # Dummy key for local models
+    }
+
+async def answer_all(questions, completion_args):
+    """
+    Answer all questions concurrently.
+
+    Args:
+        questions (list[str]): Questions to answer
+        completion_args (dict): See get_completion_args()
+
+    Returns:
+        list: Answers in the same order as questions; a question that failed
+            holds its exception instead, so one error doesn't discard the batch
+    """
+    semaphore = asyncio.Semaphore(MAX_CONCURRENCY)
+
+    async def answer(question):
+        async with semaphore:
+            response = await litellm.acompletion(
+                messages=[{"role": "user", "content": question}],
+                num_retries=2,  # Up to 3 attempts on transient errors
+                **MODEL_PARAMS,  # Same sampling parameters as agent.py
+                **completion_args
+            )
+        return response.choices[0].message.content
+
+    return await asyncio.gather(*(answer(question) for question in questions), return_exceptions=True)
+
+def main():
+    """Answer a batch of questions and print each answer."""
+    questions = load_questions()
+    if not questions:
+        print("❌ No questions provided - set QUESTIONS or QUESTIONS_FILE")
+        return
+
+    completion_args = get_completion_args()
+    print(f"📝 Processing {len(questions)} questions (max {MAX_CONCURRENCY} concurrent)")
+
+    start = time.perf_counter()
+    answers = asyncio.run(answer_all(questions, completion_args))
+    elapsed = time.perf_counter() - start
+
+    failed = 0
+    for question, answer in zip(questions, answers):
+        print("\n" + "=" * 60)
+        print(f"🎯 {question}")
+        if isinstance(answer, Exception):
+            failed += 1
+            print(f"❌ Error: {answer}")
+        else:
+            print(answer)
+    print("=" * 60)
+    print(f"✅ Answered {len(questions) - failed} of {len(questions)} questions in {elapsed:.1f}s")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,395 @@
+"""
+Response Cache for the MCP Agent (v7)
+
+Every agent run re-issues the full LLM + tool trajectory, even when the same
+question was answered before. This module short-circuits repeated questions:
+
+- Exact hits: SHA-256 of the normalized request payload
+  (model_id, params, system_prompt, question)
+- Semantic hits (optional): questions whose embedding is close enough to a
+  previously answered question under the same model and prompt, looked up in
+  an in-process embedding index persisted next to the cache
+
+Each entry also records the definitions the agent saved while answering, so a
+cache hit can write the same definition files without running the agent.
+
+It also caches the MCP Gateway tool descriptors, so a container start can skip
+the tool discovery round-trip while the gateway configuration is unchanged.
+
+Storage Backends:
+- Redis, when REDIS_URL is set (shared between containers, TTL via SET EX);
+  if Redis is unreachable, lookups miss and stores are skipped
+- Local JSON files under CACHE_DIR otherwise (mount it as a Docker volume
+  to keep the cache between container runs)
+"""
+
+import atexit
+import hashlib
+import json
+import os
+import tempfile
+import time
+import zipfile
+from pathlib import Path
+
+# Cache configuration from environment variables
+CACHE_DIR = Path(os.getenv("CACHE_DIR", Path.home() / ".cache" / "agent"))
+REDIS_URL = os.getenv("REDIS_URL")  # e.g. redis://redis:6379/0
+RESPONSE_CACHE_TTL = int(os.getenv("RESPONSE_CACHE_TTL", "86400"))  # Seconds
+
+# Tool descriptors change only when the gateway is reconfigured; 4 hours
+# matches the tool cache expiration used by the Enkrypt Secure MCP Gateway
+TOOL_CACHE_TTL = int(os.getenv("TOOL_CACHE_TTL", "14400"))  # Seconds
+
+# Semantic cache configuration (requires sentence-transformers)
+SEMANTIC_CACHE = os.getenv("SEMANTIC_CACHE", "0") == "1"
+SEMANTIC_THRESHOLD = float(os.getenv("SEMANTIC_THRESHOLD", "0.95"))
+EMBEDDING_MODEL = os.getenv("EMBEDDING_MODEL", "all-MiniLM-L6-v2")
+
+# Most entries kept in the semantic index file; the oldest are dropped first
+SEMANTIC_MAX_ENTRIES = int(os.getenv("SEMANTIC_MAX_ENTRIES", "100000"))
+
+# Above this many entries the index switches to FAISS, when it is installed
+FAISS_MIN_ENTRIES = 10_000
+
+def normalize_question(question):
+    """Collapse case and whitespace so trivially different questions share a key."""
+    return " ".join(question.lower().split())
+
+def generate_cache_key(payload):
+    """
+    Compute a stable cache key for a request payload.
+
+    Args:
+        payload (dict): JSON-serializable request description
+
+    Returns:
+        str: Hex SHA-256 digest of the canonical JSON encoding
+    """
+    return hashlib.sha256(json.dumps(payload, sort_keys=True).encode("utf-8")).hexdigest()
+
+def load_tool_specs(server_url, ttl=TOOL_CACHE_TTL):
+    """
+    Load cached MCP tool descriptors for a gateway.
+
+    Args:
+        server_url (str): MCP Gateway URL the tools were discovered from
+        ttl (int): Maximum age of the cache file in seconds
+
+    Returns:
+        list[dict] | None: Tool descriptors, or None if missing or expired
+    """
+    path = _tool_cache_path(server_url)
+    try:
+        if time.time() - path.stat().st_mtime > ttl:
+            return None
+        return json.loads(path.read_text(encoding="utf-8"))
+    except (FileNotFoundError, ValueError):
+        return None
+
+def save_tool_specs(server_url, specs):
+    """Cache MCP tool descriptors (JSON-serializable dicts) for a gateway."""
+    path = _tool_cache_path(server_url)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(specs), encoding="utf-8")
+
+def _tool_cache_path(server_url):
+    return CACHE_DIR / f"tools_{hashlib.md5(server_url.encode('utf-8')).hexdigest()}.json"
+
+class SemanticIndex:
+    """
+    In-process embedding index mapping questions to response cache keys.
+
+    Embeddings come from a small sentence-transformer loaded once per process
+    and are kept L2-normalized in one matrix, so a lookup is a single
+    matrix-vector product (sub-millisecond for a few thousand entries) instead
+    of a Python loop. Large indexes use a FAISS inner-product index if faiss is
+    installed.
+
+    The index is saved to CACHE_DIR/embcache.npz once, when the process exits,
+    rather than on every insert. Saving takes a lock, merges in entries that
+    other containers sharing the cache volume saved meanwhile, drops entries
+    older than the response TTL and keeps at most max_entries (newest first),
+    then atomically replaces the file. A file that cannot be read or was built
+    with a different embedding model is ignored and the index starts empty.
+    """
+
+    def __init__(self, path=None, ttl=RESPONSE_CACHE_TTL, max_entries=SEMANTIC_MAX_ENTRIES):
+        # Optional dependencies: pip install .[cache]
+        import numpy as np
+        from sentence_transformers import SentenceTransformer
+
+        self._np = np
+        self.path = path or CACHE_DIR / "embcache.npz"
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.model = SentenceTransformer(EMBEDDING_MODEL)
+        self.dimension = self.model.get_sentence_embedding_dimension()
+
+        self.embeddings = np.empty((0, self.dimension), dtype=np.float32)
+        self.keys = []
+        self.scopes = []
+        self.added = []  # Insertion time of each row, for TTL pruning
+        self._discarded = set()  # Keys removed since the last save
+        self._dirty = False
+        self._faiss_index = None
+
+        saved = self._read()
+        if saved is not None:
+            self.embeddings, self.keys, self.scopes, self.added = saved
+            self._prune()
+
+        atexit.register(self.save)
+
+    def embed(self, question):
+        """Return the normalized embedding of a question as a float32 vector."""
+        return self.model.encode([normalize_question(question)], normalize_embeddings=True)[0].astype(self._np.float32)
+
+    def add(self, scope, question, key):
+        """Index question (within scope) as answered by cache entry key."""
+        self.embeddings = self._np.vstack([self.embeddings, self.embed(question)])
+        self.keys.append(key)
+        self.scopes.append(scope)
+        self.added.append(time.time())
+        self._discarded.discard(key)
+        self._faiss_index = None
+        self._dirty = True
+
+    def discard(self, key):
+        """Remove a key whose response is gone (expired or evicted)."""
+        self._discarded.add(key)
+        self._keep([k != key for k in self.keys])
+        self._dirty = True
+
+    def search(self, scope, question, threshold=SEMANTIC_THRESHOLD):
+        """
+        Find cache keys of similar questions in the same scope.
+
+        Yields:
+            str: Cache keys reaching threshold, most similar first
+        """
+        if not self.keys:
+            return
+
+        query = self.embed(question)
+        # Embeddings are normalized, so the inner product is the cosine similarity.
+        # Keys are collected first so the caller may discard() while iterating
+        matches = []
+        for similarity, i in self._nearest(query):
+            if similarity < threshold:
+                break
+            if self.scopes[i] == scope:
+                matches.append(self.keys[i])
+        yield from matches
+
+    def save(self):
+        """Merge the index into its file on disk (no-op if nothing changed)."""
+        if not self._dirty:
+            return
+
+        import fcntl  # Unix only, like the containers the agent runs in
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.path.with_suffix(".lock"), "a") as lock:
+            # Serialize saves from containers sharing the cache volume
+            fcntl.flock(lock, fcntl.LOCK_EX)
+
+            saved = self._read()
+            if saved is not None:
+                self._merge(*saved)
+            self._prune()
+            self._write()
+
+        self._discarded.clear()
+        self._dirty = False
+
+    def _merge(self, embeddings, keys, scopes, added):
+        # Take rows saved by other processes unless we hold (or dropped) that key
+        known = set(self.keys) | self._discarded
+        rows = [i for i, key in enumerate(keys) if key not in known]
+        if rows:
+            self.embeddings = self._np.vstack([embeddings[rows], self.embeddings])
+            self.keys = [keys[i] for i in rows] + self.keys
+            self.scopes = [scopes[i] for i in rows] + self.scopes
+            self.added = [added[i] for i in rows] + self.added
+            self._faiss_index = None
+
+    def _prune(self):
+        # Drop entries whose response has expired, then keep the newest max_entries
+        cutoff = time.time() - self.ttl
+        self._keep([t >= cutoff for t in self.added])
+        if len(self.keys) > self.max_entries:
+            newest = set(self._np.argsort(self.added)[-self.max_entries:].tolist())
+            self._keep([i in newest for i in range(len(self.keys))])
+
+    def _keep(self, mask):
+        if all(mask):
+            return
+        self.embeddings = self.embeddings[self._np.array(mask, dtype=bool)]
+        self.keys = [k for k, m in zip(self.keys, mask) if m]
+        self.scopes = [s for s, m in zip(self.scopes, mask) if m]
+        self.added = [t for t, m in zip(self.added, mask) if m]
+        self._faiss_index = None
+
+    def _nearest(self, query, k=10):
+        """Yield (similarity, row) for the top k candidates, most similar first."""
+        k = min(k, len(self.keys))
+        if len(self.keys) > FAISS_MIN_ENTRIES:
+            index = self._get_faiss_index()
+            if index is not None:
+                similarities, rows = index.search(query[None, :], k)
+                yield from zip(similarities[0].tolist(), rows[0].tolist())
+                return
+
+        similarities = self.embeddings @ query
+        rows = self._np.argpartition(-similarities, k - 1)[:k]
+        for i in rows[self._np.argsort(-similarities[rows])].tolist():
+            yield float(similarities[i]), i
+
+    def _get_faiss_index(self):
+        if self._faiss_index is None:
+            try:
+                import faiss  # Optional: pip install faiss-cpu
+            except ImportError:
+                return None
+            self._faiss_index = faiss.IndexFlatIP(self.dimension)
+            self._faiss_index.add(self.embeddings)
+        return self._faiss_index
+
+    def _read(self):
+        """Read the saved index; an unreadable or incompatible file is ignored."""
+        if not self.path.exists():
+            return None
+        try:
+            with self._np.load(self.path) as data:
+                embeddings = data["embeddings"]
+                keys = data["keys"].tolist()
+                scopes = data["scopes"].tolist()
+                # Files saved before insertion times were recorded count as new
+                added = data["added"].tolist() if "added" in data else [time.time()] * len(keys)
+        except (OSError, ValueError, KeyError, EOFError, zipfile.BadZipFile) as e:
+            print(f"⚠️ Ignoring unreadable semantic index {self.path}: {e}")
+            return None
+
+        if embeddings.ndim != 2 or embeddings.shape[1] != self.dimension or len({len(embeddings), len(keys), len(scopes), len(added)}) != 1:
+            # Written by a different embedding model (or truncated); start empty
+            print(f"⚠️ Ignoring semantic index {self.path}: incompatible with {EMBEDDING_MODEL}")
+            return None
+
+        return embeddings.astype(self._np.float32, copy=False), keys, scopes, added
+
+    def _write(self):
+        # Write a temporary file next to the index and rename it over the old one,
+        # so a crash mid-write never leaves a truncated index behind
+        fd, tmp_path = tempfile.mkstemp(dir=self.path.parent, prefix=".embcache-", suffix=".npz")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                self._np.savez(
+                    f,
+                    embeddings=self.embeddings,
+                    keys=self._np.array(self.keys, dtype=str),
+                    scopes=self._np.array(self.scopes, dtype=str),
+                    added=self._np.array(self.added, dtype=self._np.float64),
+                )
+            os.replace(tmp_path, self.path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+
+class ResponseCache:
+    """
+    Request-level cache for agent responses.
+
+    Usage:
+        cache = ResponseCache()
+        entry = cache.lookup(payload)
+        if entry is None:
+            response = str(agent(question))
+            cache.store(payload, response, definitions)
+
+    The payload must contain a "question" entry; everything else in it
+    (model, parameters, system prompt) scopes which answers may be reused.
+    """
+
+    def __init__(self, ttl=RESPONSE_CACHE_TTL):
+        self.ttl = ttl
+        self._redis = None
+        self._redis_error = ()  # Catches nothing unless Redis is configured
+        self._dir = CACHE_DIR / "responses"
+        self._index = SemanticIndex(ttl=ttl) if SEMANTIC_CACHE else None
+
+        if REDIS_URL:
+            import redis  # Optional dependency: pip install .[cache]
+            self._redis = redis.Redis.from_url(REDIS_URL)
+            self._redis_error = redis.RedisError
+
+    def lookup(self, payload):
+        """
+        Return the cache entry for payload, or None on a miss.
+
+        Returns:
+            dict | None: {"response": str, "definitions": [[word, definition], ...]}
+        """
+        # A cache outage must not become an agent outage: treat it as a miss
+        try:
+            return self._lookup(payload)
+        except self._redis_error as e:
+            print(f"⚠️ Response cache unavailable, skipping lookup: {e}")
+            return None
+
+    def _lookup(self, payload):
+        key = self._key(payload)
+        entry = self._get(key)
+        if entry is None and self._index is not None:
+            # Try similar questions in order, dropping ones whose response is gone
+            for key in self._index.search(self._scope(payload), payload["question"]):
+                entry = self._get(key)
+                if entry is not None:
+                    break
+                self._index.discard(key)
+        return entry
+
+    def store(self, payload, response, definitions=()):
+        """Cache response and saved definitions for payload (and index it for semantic lookups)."""
+        key = self._key(payload)
+        self._set(key, {"response": response, "definitions": [list(d) for d in definitions]})
+        if self._index is not None:
+            self._index.add(self._scope(payload), payload["question"], key)
+
+    def _key(self, payload):
+        return generate_cache_key({**payload, "question": normalize_question(payload["question"])})
+
+    def _scope(self, payload):
+        return generate_cache_key({k: v for k, v in payload.items() if k != "question"})
+
+    def _get(self, key):
+        if self._redis is not None:
+            value = self._redis.get(f"agent:response:{key}")
+            return self._decode(value) if value is not None else None
+
+        path = self._dir / f"{key}.json"
+        try:
+            if time.time() - path.stat().st_mtime > self.ttl:
+                return None
+            return self._decode(path.read_bytes())
+        except FileNotFoundError:
+            return None
+
+    def _set(self, key, entry):
+        if self._redis is not None:
+            try:
+                self._redis.set(f"agent:response:{key}", json.dumps(entry), ex=self.ttl)
+            except self._redis_error as e:
+                print(f"⚠️ Response cache unavailable, response not cached: {e}")
+            return
+
+        self._dir.mkdir(parents=True, exist_ok=True)
+        (self._dir / f"{key}.json").write_text(json.dumps(entry), encoding="utf-8")
+
+    def _decode(self, value):
+        # Entries that cannot be read (e.g. written by an older version) are misses
+        try:
+            entry = json.loads(value)
+            return {"response": entry["response"], "definitions": entry.get("definitions", [])}
+        except (ValueError, KeyError, TypeError, AttributeError):
+            return None
@@ -0,0 +1,17 @@
+"""
+Shared Model Parameters for the MCP Agent (v7)
+
+Kept in a dependency-free module so agent.py and batch_agent.py send exactly
+the same sampling parameters without batch_agent.py importing the full agent.
+"""
+
+# Sampling parameters shared by local and cloud models. Deterministic settings
+# give reproducible definitions, and identical requests let provider-side
+# prompt caching reuse the (constant) system prompt prefix
+MODEL_PARAMS = {
+    "temperature": 0.0,
+    "top_p": 1.0,
+    "frequency_penalty": 0.0,
+    "presence_penalty": 0.0,
+    "max_tokens": 1000,  # Allow longer responses for definitions
+}
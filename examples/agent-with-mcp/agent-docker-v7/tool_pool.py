@@ -0,0 +1,77 @@
+"""
+Rate-Limited Tool Pool for the MCP Agent (v7)
+
+Strands runs independent tool calls concurrently, and batches of questions
+(QUESTIONS) multiply that fan-out. This module bounds MCP tool traffic so
+parallel tool calls stay within what the upstream services accept:
+
+- ToolPool: at most max_concurrency calls in flight, at most rpm calls per minute
+- PooledTool: wraps an MCP tool so every invocation goes through a ToolPool
+
+Usage:
+    pool = ToolPool()
+    tools = [PooledTool(t, pool) for t in mcp_tools]
+"""
+
+import asyncio
+import os
+from aiolimiter import AsyncLimiter
+from strands.types.tools import AgentTool
+
+# Tool pool configuration from environment variables
+TOOL_MAX_CONCURRENCY = int(os.getenv("TOOL_MAX_CONCURRENCY", "10"))
+TOOL_RPM = int(os.getenv("TOOL_RPM", "100"))  # Match the upstream rate limit
+
+class ToolPool:
+    """
+    Concurrency and rate limit shared by a set of tools.
+
+    The semaphore and limiter bind to the event loop they are first used in,
+    so create one pool per run.
+    """
+
+    def __init__(self, max_concurrency=TOOL_MAX_CONCURRENCY, rpm=TOOL_RPM):
+        self.semaphore = asyncio.Semaphore(max_concurrency)
+        self.limiter = AsyncLimiter(rpm, 60)
+
+    async def __aenter__(self):
+        await self.semaphore.acquire()
+        try:
+            await self.limiter.acquire()
+        except BaseException:
+            self.semaphore.release()
+            raise
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        self.semaphore.release()
+
+class PooledTool(AgentTool):
+    """
+    Agent tool that runs another tool through a ToolPool.
+
+    Name, spec and type are delegated unchanged, so the model sees exactly
+    the same tool; only execution is throttled.
+    """
+
+    def __init__(self, tool, pool):
+        super().__init__()
+        self.tool = tool
+        self.pool = pool
+
+    @property
+    def tool_name(self):
+        return self.tool.tool_name
+
+    @property
+    def tool_spec(self):
+        return self.tool.tool_spec
+
+    @property
+    def tool_type(self):
+        return self.tool.tool_type
+
+    async def stream(self, tool_use, invocation_state, **kwargs):
+        async with self.pool:
+            async for event in self.tool.stream(tool_use, invocation_state, **kwargs):
+                yield event